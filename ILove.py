@@ -69,7 +69,7 @@ def load_config():
         if not os.path.exists(CONFIG_FILE):
             logger.error(f"Config file '{CONFIG_FILE}' not found.")
             return None
-        with open(CONFIG_FILE, 'r') as f:
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
         logger.error(f"Error loading config: {e}")
@@ -126,7 +126,7 @@ def fetch_dexscreener_data(token_mint):
         dex_screener.update_data_tokens()
         
         # Load the updated data
-        with open('data_tokens.json', 'r') as f:
+        with open('data_tokens.json', 'r', encoding='utf-8') as f:
             tokens_data = json.load(f)
         
         # Find our token
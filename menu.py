@@ -5,19 +5,154 @@ import subprocess
 import time
 import platform
 from threading import Thread
-from queue import Queue, Empty
+from collections import deque
 import json
+import codecs
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+_IS_WINDOWS = platform.system() == 'Windows'
 
 # Platform-specific key input handling
-if platform.system() == 'Windows':
+if _IS_WINDOWS:
     import msvcrt
+    import ctypes
+    from ctypes import wintypes
 else:
-    import tty
     import termios
-    import sys
     import select
+    import selectors
+    import signal
+
+# settings_config.json is edited by hand, so it is written indented (2 spaces,
+# raw UTF-8); the orjson and json branches produce identical bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
 CONFIG_FILE = 'settings_config.json'
+LOG_HISTORY_LINES = 2000
+# Minimum seconds between log view repaints; output arriving faster is
+# coalesced into the next frame
+LOG_FRAME_INTERVAL = 0.04
+
+_MENU_ART_LINES = r"""
+     █████    █████                                    
+    ░░███    ░░███                                     
+     ░███     ░███         ██████  █████ █████  ██████ 
+     ░███     ░███        ███░░███░░███ ░░███  ███░░███
+     ░███     ░███       ░███ ░███ ░███  ░███ ░███████ 
+     ░███     ░███      █░███ ░███ ░░███ ███  ░███░░░  
+     █████    ███████████░░██████   ░░█████   ░░██████ 
+    ░░░░░    ░░░░░░░░░░░  ░░░░░░     ░░░░░     ░░░░░░  
+                                                       
+                                                       
+                                                       
+      █████████     ███████    █████                   
+     ███░░░░░███  ███░░░░░███ ░░███                    
+    ░███    ░░░  ███     ░░███ ░███                    
+    ░░█████████ ░███      ░███ ░███                    
+     ░░░░░░░░███░███      ░███ ░███                    
+     ███    ░███░░███     ███  ░███      █             
+    ░░█████████  ░░░███████░   ███████████             
+     ░░░░░░░░░     ░░░░░░░    ░░░░░░░░░░░
+    """.split('\n')
+_MENU_ART_WIDTH = max(map(len, _MENU_ART_LINES))
+
+_GEAR_ART_LINES = r"""
+      ░░░░░░
+  ░░░░      ░░░░
+░░    ██████    ░░
+░░  ██████████  ░░
+░░  ██████████  ░░
+░░    ██████    ░░
+  ░░░░      ░░░░
+      ░░░░░░
+""".split('\n')
+_GEAR_ART_WIDTH = max(map(len, _GEAR_ART_LINES))
+
+# Indexed by a bool setting's value
+_BOOL_LABELS = ("❌ Off", "✅ On")
+
+# Hash of the last frame written by _emit(), used to skip identical repaints
+_last_frame_hash = None
+
+_ESCAPE_KEYS = {b'[A': 'up', b'[B': 'down', b'[C': 'right', b'[D': 'left'}
+# Bytes read by get_key() beyond the key it returned
+_pending_input = b''
+
+# Lets a child exit or new log output interrupt a blocking get_key() so the
+# screen can redraw. POSIX: _wake_ui() writes into a self-pipe that get_key()
+# waits on together with stdin (both registered on _selector in main()).
+# Windows: _wake_ui() signals an event that get_key() waits on together with
+# the console input handle (the log reader calls it on child exit).
+if _IS_WINDOWS:
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateEventW.argtypes = (ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR)
+    _kernel32.CreateEventW.restype = wintypes.HANDLE
+    _kernel32.SetEvent.argtypes = (wintypes.HANDLE,)
+    _kernel32.GetStdHandle.argtypes = (wintypes.DWORD,)
+    _kernel32.GetStdHandle.restype = wintypes.HANDLE
+    _kernel32.WaitForMultipleObjects.argtypes = (wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD)
+    _kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+    _kernel32.GetNumberOfConsoleInputEvents.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+    _kernel32.ReadConsoleInputW.argtypes = (wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD))
+    _STD_INPUT_HANDLE = -10
+    _INFINITE = 0xFFFFFFFF
+    _WAIT_FAILED = 0xFFFFFFFF
+    _INPUT_RECORD_SIZE = 20
+    _console_in = _kernel32.GetStdHandle(_STD_INPUT_HANDLE)
+    # Auto-reset: the wait that reports it also clears it
+    _wake_event = _kernel32.CreateEventW(None, False, False, None)
+    _wait_handles = (wintypes.HANDLE * 2)(_console_in, _wake_event)
+else:
+    _wake_r, _wake_w = os.pipe()
+    os.set_blocking(_wake_r, False)
+    os.set_blocking(_wake_w, False)
+    _selector = selectors.DefaultSelector()
+
+def _wake_ui():
+    if _IS_WINDOWS:
+        _kernel32.SetEvent(_wake_event)
+        return
+    try:
+        os.write(_wake_w, b'\0')
+    except BlockingIOError:
+        pass  # A wake-up is already pending
+
+def _on_child_exit(signum, frame):
+    _wake_ui()
+
+# Cached os.get_terminal_size(); on POSIX it is dropped by SIGWINCH, so the
+# draw functions don't issue an ioctl per key press. Windows has no resize
+# signal and always asks the console.
+_term_size = None
+
+def _terminal_size():
+    global _term_size
+    if _IS_WINDOWS:
+        return os.get_terminal_size()
+    if _term_size is None:
+        _term_size = os.get_terminal_size()
+    return _term_size
+
+def _on_resize(signum, frame):
+    global _term_size, _last_frame_hash
+    _term_size = None
+    # The terminal may have reflowed what is on screen, so the next frame
+    # must be written even if it hashes the same as the last one
+    _last_frame_hash = None
+    _wake_ui()
 
 def load_config():
     """Load the configuration from the config file."""
@@ -40,8 +175,7 @@ def load_config():
             }
             save_config(default_config)
             return default_config
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        return _json_loads(Path(CONFIG_FILE).read_bytes())
     except (IOError, json.JSONDecodeError) as e:
         print(f"Error loading config: {e}. Loading default config.")
         # Return a default config in case of error
@@ -53,10 +187,16 @@ def load_config():
 def save_config(config):
     """Save the configuration to the config file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Write a sibling temp file and swap it in, so a crash mid-save
+        # never leaves a truncated settings file behind
+        tmp_file = CONFIG_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(config))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
         # Get terminal width for centering
-        term_width = os.get_terminal_size().columns
+        term_width = _terminal_size().columns
         save_message = "Settings saved successfully!"
         x_padding = max((term_width - len(save_message)) // 2, 0)
         print(' ' * x_padding + save_message)
@@ -70,44 +210,69 @@ class ProcessManager:
         self.script_name = script_name
         self.process = None
         self.log_file = log_file
-        self.log_queue = Queue()
+        self.log_lines = deque(maxlen=LOG_HISTORY_LINES)
+        self.log_version = 0
+        # Set while the log view is open so new output wakes it immediately
+        self.notify_output = False
         self.running = False
+        self._log_fd = None
+        self._reader = None
 
     def start(self):
         if not self.process or self.process.poll() is not None:
             self.running = True
-            with open(self.log_file, 'w') as f:
-                f.write(f"--- Starting {self.script_name} ---\n")
+            self.log_lines.clear()
+            # Opened once per run; O_APPEND makes every write a single atomic append
+            self._log_fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+            os.write(self._log_fd, f"--- Starting {self.script_name} ---\n".encode())
             self.process = subprocess.Popen(
                 [sys.executable, self.script_name],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=-1
             )
-            Thread(target=self.log_reader, daemon=True).start()
+            self._reader = Thread(target=self.log_reader, args=(self.process, self._log_fd), daemon=True)
+            self._reader.start()
             return True
         return False
 
-    def log_reader(self):
-        while self.running:
-            if self.process and self.process.stdout:
+    def log_reader(self, process, log_fd):
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pipe_fd = process.stdout.fileno()
+        tail = ''
+        try:
+            # Read to EOF even after stop(), so whatever the child prints while
+            # shutting down still reaches the log
+            while True:
                 try:
-                    line = self.process.stdout.readline()
-                    if line:
-                        self.log_queue.put(line)
-                        with open(self.log_file, 'a') as f:
-                            f.write(line)
-                    else:
-                        # Process has likely ended
-                        if self.process.poll() is not None:
-                            break
-                        time.sleep(0.1)
-                except Exception:
+                    # Blocks until output is available; b'' means the child closed its end
+                    chunk = os.read(pipe_fd, 65536)
+                except OSError:
                     break
-            else:
-                break
-        self.running = False
+                if not chunk:
+                    break
+                os.write(log_fd, chunk)
+                lines = (tail + decoder.decode(chunk)).split('\n')
+                tail = lines.pop()
+                self.log_lines.extend(lines)
+                self.log_version += 1
+                if self.notify_output:
+                    _wake_ui()
+            tail += decoder.decode(b'', final=True)
+            if tail:
+                self.log_lines.append(tail)
+                self.log_version += 1
+        finally:
+            os.close(log_fd)
+            process.stdout.close()
+            if _IS_WINDOWS:
+                # EOF means the child is exiting; with no SIGCHLD on Windows
+                # the reader is what tells the menu to refresh its status
+                process.wait()
+                _wake_ui()
+            if self.process is process:
+                self._log_fd = None
+                self.running = False
 
 
     def stop(self):
@@ -118,17 +283,21 @@ class ProcessManager:
                 self.process.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 self.process.kill()
+            # The reader closes the log fd once it has drained the pipe; the
+            # timeout covers a grandchild still holding the pipe open
+            if self._reader:
+                self._reader.join(timeout=1)
             return True
         return False
 
-    def get_logs(self):
-        lines = []
-        while True:
-            try:
-                lines.append(self.log_queue.get_nowait())
-            except Empty:
-                break
-        return ''.join(lines)
+    def get_logs(self, max_lines=None):
+        """Return the most recent `max_lines` lines of output (all kept lines by default)."""
+        # Snapshot in a single C call: iterating the deque itself can race the
+        # reader thread's extend() and raise "deque mutated during iteration"
+        lines = list(self.log_lines)
+        if max_lines is not None:
+            lines = lines[-max_lines:] if max_lines > 0 else []
+        return '\n'.join(lines)
 
     def get_status(self):
         if self.process and self.process.poll() is None:
@@ -136,168 +305,296 @@ class ProcessManager:
         return "STOPPED"
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-def get_key():
-    if platform.system() == 'Windows':
+    global _last_frame_hash
+    if _IS_WINDOWS:
+        os.system('cls')
+    else:
+        # What `clear` prints, without forking a child that would raise SIGCHLD
+        sys.stdout.write('\x1b[H\x1b[2J\x1b[3J')
+        sys.stdout.flush()
+    _last_frame_hash = None
+
+@lru_cache(maxsize=256)
+def _pad(n):
+    """Return n spaces; widths repeat from frame to frame, so they are cached."""
+    return ' ' * n
+
+@lru_cache(maxsize=8)
+def _menu_art_block(x_padding):
+    """The main-menu art, indented and joined; only changes with the terminal width."""
+    return '\n'.join(_pad(x_padding) + line for line in _MENU_ART_LINES)
+
+def _display_width(text):
+    """Terminal columns `text` takes: wide (CJK, emoji) chars count 2, combining marks 0."""
+    if text.isascii():
+        return len(text)
+    width = 0
+    for ch in text:
+        if unicodedata.category(ch) in ('Mn', 'Me', 'Cf'):
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+    return width
+
+def _wrapped_rows(text, columns):
+    """Screen rows `text` occupies once the terminal wraps it."""
+    return max(1, -(-_display_width(text) // columns))
+
+def _log_tail(lines, rows, columns):
+    """The newest of `lines` that fit in `rows` screen rows, counting wrapped lines in full."""
+    shown = []
+    for line in reversed(lines):
+        needed = _wrapped_rows(line, columns)
+        if needed > rows:
+            if not shown:
+                # A single line taller than the screen: keep its end
+                tail = line[-rows * columns:]
+                while _wrapped_rows(tail, columns) > rows:
+                    tail = tail[columns // 2 or 1:]
+                shown.append(tail)
+            break
+        shown.append(line)
+        rows -= needed
+    shown.reverse()
+    return shown
+
+def _write_stdout(data):
+    """Write bytes straight to fd 1, bypassing the sys.stdout text layer."""
+    sys.stdout.flush()  # Keep ordering with anything still buffered by print()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+def _show_screen(text):
+    """Replace the whole screen with `text` in a single write."""
+    global _last_frame_hash
+    sys.stdout.write('\x1b[H\x1b[J' + text)
+    sys.stdout.flush()
+    _last_frame_hash = None
+
+def _emit(frame):
+    """Repaint the screen with the given lines, unless they are already what is shown."""
+    global _last_frame_hash
+    frame_str = '\n'.join(frame) + '\n'
+    frame_hash = hash(frame_str)
+    if frame_hash == _last_frame_hash:
+        return
+    _last_frame_hash = frame_hash
+    sys.stdout.write('\x1b[H\x1b[J' + frame_str)
+    sys.stdout.flush()
+
+@contextmanager
+def raw_mode():
+    """Keep the terminal in unbuffered, no-echo input mode for the whole session."""
+    if _IS_WINDOWS:
+        yield
+        return
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    # Like tty.setcbreak, but also swallow Ctrl-C as the per-key setraw used to.
+    # Output processing stays on so '\n' still returns the carriage.
+    mode = termios.tcgetattr(fd)
+    mode[3] &= ~(termios.ECHO | termios.ICANON | termios.ISIG)
+    mode[6][termios.VMIN] = 1
+    mode[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSAFLUSH, mode)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+@contextmanager
+def cooked_mode():
+    """Temporarily restore line-buffered, echoing input (e.g. for input())."""
+    if _IS_WINDOWS:
+        yield
+        return
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    mode = termios.tcgetattr(fd)
+    mode[3] |= termios.ECHO | termios.ICANON | termios.ISIG
+    termios.tcsetattr(fd, termios.TCSADRAIN, mode)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _discard_console_events():
+    """Drop queued console events that are not key presses (key-ups, focus, mouse)."""
+    count = wintypes.DWORD()
+    _kernel32.GetNumberOfConsoleInputEvents(_console_in, ctypes.byref(count))
+    # Counted before kbhit() looks, so if it finds no key press none of the
+    # first `count` events is one; any key arriving later stays queued
+    if count.value and not msvcrt.kbhit():
+        records = ctypes.create_string_buffer(_INPUT_RECORD_SIZE * count.value)
+        _kernel32.ReadConsoleInputW(_console_in, records, count, ctypes.byref(count))
+
+def _get_key_windows(timeout=None):
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not msvcrt.kbhit():
+        if deadline is None:
+            wait_ms = _INFINITE
+        else:
+            wait_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+        # Sleeps until console input arrives or _wake_ui() is called
+        signalled = _kernel32.WaitForMultipleObjects(2, _wait_handles, False, wait_ms)
+        if signalled == _WAIT_FAILED:
+            # stdin is not a waitable console (IDE, redirected input); retrying
+            # would fail again at once, so block in getch() as before
+            break
+        if signalled != 0:
+            return None  # Woken or timed out
+        # The input handle is also signalled by events getch() never reads;
+        # drop them or the next wait would return at once
+        _discard_console_events()
+    key = msvcrt.getch()
+    if key == b'\xe0':
         key = msvcrt.getch()
-        if key == b'\xe0':
-            key = msvcrt.getch()
-            return {'H': 'up', 'P': 'down'}.get(key.decode(errors='ignore'), 'unknown')
-        elif key == b'\r':
-            return 'enter'
-        return key.decode(errors='ignore')
+        return {'H': 'up', 'P': 'down'}.get(key.decode(errors='ignore'), 'unknown')
+    elif key == b'\r':
+        return 'enter'
+    return key.decode(errors='ignore')
+
+def _get_key_posix(timeout=None):
+    global _pending_input
+    fd = sys.stdin.fileno()
+    if not _pending_input:
+        ready = [key.fd for key, _ in _selector.select(timeout)]
+        if _wake_r in ready:
+            os.read(_wake_r, 512)
+        if fd not in ready:
+            return None
+        # One read picks up a whole escape sequence (e.g. b'\x1b[A')
+        _pending_input = os.read(fd, 8)
+    buf = _pending_input
+    if buf[:1] == b'\x1b':
+        if len(buf) < 3 and select.select([fd], [], [], 0.05)[0]:
+            # The sequence was split across reads (slow link)
+            buf += os.read(fd, 8)
+        key, used = _ESCAPE_KEYS.get(buf[1:3], 'unknown'), 3
+    elif buf[:1] in (b'\r', b'\n'):
+        key, used = 'enter', 1
     else:
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-            if ch == '\x1b':
-                ch_rest = sys.stdin.read(2)
-                ch += ch_rest
-                return {'[A': 'up', '[B': 'down'}.get(ch[1:], 'unknown')
-            elif ch == '\r':
-                return 'enter'
-            return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-
-def draw_menu(options, selected_index):
-    clear_screen()
-    art = r"""
-     █████    █████                                    
-    ░░███    ░░███                                     
-     ░███     ░███         ██████  █████ █████  ██████ 
-     ░███     ░███        ███░░███░░███ ░░███  ███░░███
-     ░███     ░███       ░███ ░███ ░███  ░███ ░███████ 
-     ░███     ░███      █░███ ░███ ░░███ ███  ░███░░░  
-     █████    ███████████░░██████   ░░█████   ░░██████ 
-    ░░░░░    ░░░░░░░░░░░  ░░░░░░     ░░░░░     ░░░░░░  
-                                                       
-                                                       
-                                                       
-      █████████     ███████    █████                   
-     ███░░░░░███  ███░░░░░███ ░░███                    
-    ░███    ░░░  ███     ░░███ ░███                    
-    ░░█████████ ░███      ░███ ░███                    
-     ░░░░░░░░███░███      ░███ ░███                    
-     ███    ░███░░███     ███  ░███      █             
-    ░░█████████  ░░░███████░   ███████████             
-     ░░░░░░░░░     ░░░░░░░    ░░░░░░░░░░░
-    """
-    lines = art.split('\n')
-    width = max(len(line) for line in lines)
-    height = len(lines)
-    
-    term_width = os.get_terminal_size().columns
-    term_height = os.get_terminal_size().lines
+        key = buf.decode(errors='ignore')[:1]
+        used = len(key.encode()) or 1
+    # Keys typed ahead arrive in the same read; keep them for the next call
+    _pending_input = buf[used:]
+    return key
+
+# get_key(timeout=None) reads one key press; call it inside raw_mode().
+# Returns None if no key arrives within `timeout` seconds, or as soon as the
+# UI is woken (child exit, new log output, resize). Bound once at import so
+# the key path has no platform branch.
+get_key = _get_key_windows if _IS_WINDOWS else _get_key_posix
+
+def draw_menu(options, selected_index, menu_width):
+    frame = []
+    term_width, term_height = _terminal_size()
     
-    x_padding = max((term_width - width) // 2, 0)
-    y_padding = max((term_height - height - len(options) - 7) // 2, 0)
+    x_padding = max((term_width - _MENU_ART_WIDTH) // 2, 0)
+    y_padding = max((term_height - len(_MENU_ART_LINES) - len(options) - 7) // 2, 0)
     
-    print('\n' * y_padding)
-    for line in lines:
-        print(' ' * x_padding + line)
-    print("\n" + ' ' * ((term_width - 28) // 2))
-    print(' ' * ((term_width - 28) // 2) + "Unstable SOL Trading Bot v1.0")
-    print("\n" + ' ' * ((term_width - 20) // 1))
+    frame.append('\n' * y_padding)
+    frame.append(_menu_art_block(x_padding))
+    frame.append("\n" + _pad((term_width - 28) // 2))
+    frame.append(_pad((term_width - 28) // 2) + "Unstable SOL Trading Bot v1.0")
+    frame.append("\n" + _pad((term_width - 20) // 1))
     
-    menu_width = max(len(option) for option in options) + 4
     menu_x_padding = max((term_width - menu_width) // 2, 0)
     
     for i, option in enumerate(options):
         if i == selected_index:
-            print(' ' * menu_x_padding + f" > {option}")
+            frame.append(_pad(menu_x_padding) + f" > {option}")
         else:
-            print(' ' * menu_x_padding + f"   {option}")
-    print('\n' + ' ' * menu_x_padding + '-' * (menu_width - 2))
-    print(' ' * menu_x_padding + "Use ↑/↓ to Navigate, Enter to Select")
+            frame.append(_pad(menu_x_padding) + f"   {option}")
+    frame.append('\n' + _pad(menu_x_padding) + '-' * (menu_width - 2))
+    frame.append(_pad(menu_x_padding) + "Use ↑/↓ to Navigate, Enter to Select")
+    _emit(frame)
 
 def draw_settings_submenu(title, options, selected_index, config, config_key):
-    clear_screen()
-    art = r"""
-      ░░░░░░
-  ░░░░      ░░░░
-░░    ██████    ░░
-░░  ██████████  ░░
-░░  ██████████  ░░
-░░    ██████    ░░
-  ░░░░      ░░░░
-      ░░░░░░
-"""
+    frame = []
+    term_width, term_height = _terminal_size()
     
-    lines = art.split('\n')
-    width = max(len(line) for line in lines)
-    
-    term_width = os.get_terminal_size().columns
-    term_height = os.get_terminal_size().lines
-    
-    x_padding_art = max((term_width - width) // 2, 0)
+    x_padding_art = max((term_width - _GEAR_ART_WIDTH) // 2, 0)
     
     menu_height = len(options) + 7
-    total_height = len(lines) + menu_height
+    total_height = len(_GEAR_ART_LINES) + menu_height
     y_padding = max((term_height - total_height) // 2, 0)
     
-    print('\n' * y_padding)
-    for line in lines:
-        print(' ' * x_padding_art + line)
+    frame.append('\n' * y_padding)
+    for line in _GEAR_ART_LINES:
+        frame.append(_pad(x_padding_art) + line)
 
     title_line = f"--- {title} ---"
     x_padding_title = max((term_width - len(title_line)) // 2, 0)
-    print(f"\n{' ' * x_padding_title}{title_line}\n")
+    frame.append(f"\n{_pad(x_padding_title)}{title_line}\n")
     
-    max_len = 0
+    section = config[config_key]
+    option_lines = []
     for option_text, key in options:
-        value = config[config_key].get(key)
-        display_value = ""
-        if isinstance(value, bool):
-            display_value = "✅ On" if value else "❌ Off"
-        else:
-            display_value = str(value)
-        max_len = max(max_len, len(f"{option_text}: {display_value}"))
+        value = section.get(key)
+        display_value = _BOOL_LABELS[value] if isinstance(value, bool) else str(value)
+        option_lines.append(f"{option_text}: {display_value}")
 
-    menu_width = max_len + 6
+    menu_width = max(map(len, option_lines)) + 6
     menu_x_padding = max((term_width - menu_width) // 2, 0)
 
-    for i, (option_text, key) in enumerate(options):
-        value = config[config_key].get(key)
-        display_value = ""
-        if isinstance(value, bool):
-            display_value = "✅ On" if value else "❌ Off"
-        else:
-            display_value = str(value)
-        
-        line = f"{option_text}: {display_value}" 
-        
+    for i, line in enumerate(option_lines):
         if i == selected_index:
-            print(' ' * menu_x_padding + f" > {line}")
+            frame.append(_pad(menu_x_padding) + f" > {line}")
         else:
-            print(' ' * menu_x_padding + f"   {line}")
+            frame.append(_pad(menu_x_padding) + f"   {line}")
             
-    print("\n" + ' ' * menu_x_padding + "-" * (menu_width - 2))
-    print(' ' * menu_x_padding + "Use ↑/↓ to Navigate, Enter to change.")
-    print(' ' * menu_x_padding + "Press 'b' to go Back (and save).")
+    frame.append("\n" + _pad(menu_x_padding) + "-" * (menu_width - 2))
+    frame.append(_pad(menu_x_padding) + "Use ↑/↓ to Navigate, Enter to change.")
+    frame.append(_pad(menu_x_padding) + "Press 'b' to go Back (and save).")
+    _emit(frame)
+
+def draw_settings_menu(options, selected_index, menu_width):
+    frame = []
+    term_width, term_height = _terminal_size()
+    
+    x_padding_art = max((term_width - _GEAR_ART_WIDTH) // 2, 0)
+    
+    menu_height = len(options) + 5
+    total_height = len(_GEAR_ART_LINES) + menu_height
+    y_padding = max((term_height - total_height) // 2, 0)
+    
+    frame.append('\n' * y_padding)
+    for line in _GEAR_ART_LINES:
+        frame.append(_pad(x_padding_art) + line)
+
+    title_line = "--- Settings ---"
+    x_padding_title = max((term_width - len(title_line)) // 2, 0)
+    frame.append(f"\n{_pad(x_padding_title)}{title_line}\n")
+
+    menu_x_padding = max((term_width - menu_width) // 2, 0)
+
+    for i, option in enumerate(options):
+        if i == selected_index:
+            frame.append(_pad(menu_x_padding) + f" > {option}")
+        else:
+            frame.append(_pad(menu_x_padding) + f"   {option}")
+    
+    frame.append("\n" + _pad(menu_x_padding) + "-" * (menu_width - 2))
+    frame.append(_pad(menu_x_padding) + "Use ↑/↓ to Navigate, Enter to select.")
+    _emit(frame)
 
 def edit_numeric_value(prompt, current_value):
-    clear_screen()
-    term_width = os.get_terminal_size().columns
-    term_height = os.get_terminal_size().lines
+    term_width, term_height = _terminal_size()
     
     prompt_line = f"--- {prompt} ---"
     input_prompt = f"Enter new value (current: {current_value}): "
     
     y_padding = max((term_height - 5) // 2, 0)
     x_padding_prompt = max((term_width - len(prompt_line)) // 2, 0)
-    
-    print('\n' * y_padding)
-    print(' ' * x_padding_prompt + prompt_line)
-    
     x_padding_input = max((term_width - len(input_prompt) - 10) // 2, 0)
-    print('\n' + ' ' * x_padding_input, end='')
+    
+    # input() prints the prompt itself, so the screen ends at its indentation
+    _show_screen('\n' * (y_padding + 1) + _pad(x_padding_prompt) + prompt_line + '\n\n' + _pad(x_padding_input))
     
     try:
-        new_value_str = input(input_prompt)
+        with cooked_mode():
+            new_value_str = input(input_prompt)
         if new_value_str:
             if isinstance(current_value, int):
                 return int(new_value_str)
@@ -340,53 +637,11 @@ def settings_menu():
         "Rugcheck Config",
         "Back to Main Menu"
     ]
+    menu_width = max(map(len, menu_options)) + 4
     current_selection = 0
 
     while True:
-        clear_screen()
-        art = r"""
-      ░░░░░░
-  ░░░░      ░░░░
-░░    ██████    ░░
-░░  ██████████  ░░
-░░  ██████████  ░░
-░░    ██████    ░░
-  ░░░░      ░░░░
-      ░░░░░░
-        """
-        
-        lines = art.split('\n')
-        width = max(len(line) for line in lines)
-        
-        term_width = os.get_terminal_size().columns
-        term_height = os.get_terminal_size().lines
-        
-        x_padding_art = max((term_width - width) // 2, 0)
-        
-        menu_height = len(menu_options) + 5
-        total_height = len(lines) + menu_height
-        y_padding = max((term_height - total_height) // 2, 0)
-        
-        print('\n' * y_padding)
-        for line in lines:
-            print(' ' * x_padding_art + line)
-
-        title_line = "--- Settings ---"
-        x_padding_title = max((term_width - len(title_line)) // 2, 0)
-        print(f"\n{' ' * x_padding_title}{title_line}\n")
-
-        menu_width = max(len(option) for option in menu_options) + 4
-        menu_x_padding = max((term_width - menu_width) // 2, 0)
-
-        for i, option in enumerate(menu_options):
-            if i == current_selection:
-                print(' ' * menu_x_padding + f" > {option}")
-            else:
-                print(' ' * menu_x_padding + f"   {option}")
-        
-        print("\n" + ' ' * menu_x_padding + "-" * (menu_width - 2))
-        print(' ' * menu_x_padding + "Use ↑/↓ to Navigate, Enter to select.")
-
+        draw_settings_menu(menu_options, current_selection, menu_width)
         key = get_key()
 
         if key == 'up':
@@ -417,20 +672,25 @@ def settings_menu():
 
 def main_menu(hunter_manager, updater_manager):
     current_selection = 0
+    shown_statuses = None
     while True:
         hunter_status = hunter_manager.get_status()
         updater_status = updater_manager.get_status()
         
-        menu_options = [
-            f"Token Hunter        [{hunter_status}]",
-            "View Hunter Logs",
-            f"Data Updater        [{updater_status}]",
-            "View Updater Logs",
-            "Settings",
-            "Exit"
-        ]
+        # The option list (and its width) only changes with the process statuses
+        if (hunter_status, updater_status) != shown_statuses:
+            shown_statuses = (hunter_status, updater_status)
+            menu_options = [
+                f"Token Hunter        [{hunter_status}]",
+                "View Hunter Logs",
+                f"Data Updater        [{updater_status}]",
+                "View Updater Logs",
+                "Settings",
+                "Exit"
+            ]
+            menu_width = max(map(len, menu_options)) + 4
         
-        draw_menu(menu_options, current_selection)
+        draw_menu(menu_options, current_selection, menu_width)
         key = get_key()
         
         if key == 'up':
@@ -462,44 +722,69 @@ def main_menu(hunter_manager, updater_manager):
                 sys.exit()
 
 def view_logs(manager):
-    clear_screen()
-    print(f"--- Live Logs for {manager.script_name} (Press any key to return) ---\n")
+    header = f"--- Live Logs for {manager.script_name} (Press any key to return) ---"
+    shown = None
+    last_paint = 0.0
+    manager.notify_output = True
     try:
         while True:
-            logs = manager.get_logs()
-            if logs:
-                print(logs, end='')
-
-            # Check for key press to exit
-            if platform.system() == 'Windows':
-                if msvcrt.kbhit():
-                    break
-            else:
-                # Use select for non-blocking check on Linux/macOS
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                    break
-            
-            time.sleep(0.2)
+            # Wakes on a key, new output, child exit or resize (SIGWINCH);
+            # Windows has no resize signal, so it re-checks every second
+            timeout = 1.0 if _IS_WINDOWS else None
+            term_size = _terminal_size()
+            if (manager.log_version, term_size) != shown:
+                # A chatty child wakes us once per pipe read; repaint at most
+                # once per LOG_FRAME_INTERVAL and pick the rest up then
+                wait = last_paint + LOG_FRAME_INTERVAL - time.monotonic()
+                if wait > 0:
+                    timeout = wait if timeout is None else min(timeout, wait)
+                else:
+                    shown = (manager.log_version, term_size)
+                    last_paint = time.monotonic()
+                    # Only the rows that fit on screen are formatted, however much
+                    # output there is. Long lines wrap as before, so count the rows
+                    # they take rather than assuming one row per line
+                    # Some ptys and serial consoles report a 0x0 size
+                    columns = max(term_size.columns, 1)
+                    rows = max(term_size.lines - 1 - _wrapped_rows(header, columns), 1)
+                    logs = manager.get_logs(rows).split('\n')
+                    body = '\n'.join(_log_tail(logs, rows, columns))
+                    _write_stdout(f"\x1b[H\x1b[J{header}\n\n{body}".encode('utf-8', 'replace'))
+
+            if get_key(timeout=timeout) is not None:
+                break
     except Exception:
         pass
-    # Consume the key press that broke the loop
-    get_key()
+    finally:
+        manager.notify_output = False
 
 
 def main():
+    # Don't hold text in Python's io layer between the frames we write
+    sys.stdout.reconfigure(write_through=True)
+    if _IS_WINDOWS:
+        os.system('')  # Enables ANSI escape handling in the Windows console
+    else:
+        _selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+        _selector.register(_wake_r, selectors.EVENT_READ)
+        signal.signal(signal.SIGCHLD, _on_child_exit)
+        signal.signal(signal.SIGWINCH, _on_resize)
     hunter_manager = ProcessManager('ILove.py', 'hunter.log')
     updater_manager = ProcessManager('ultimate_utils.py', 'updater.log')
     
-    while True:
-        action = main_menu(hunter_manager, updater_manager)
-        
-        if action == 'view_hunter_logs':
-            view_logs(hunter_manager)
-        elif action == 'view_updater_logs':
-            view_logs(updater_manager)
-        elif action == 'settings':
-            settings_menu()
-        clear_screen()
+    # Stay in cbreak mode for the whole session; the with block restores the
+    # terminal on every way out, including the sys.exit() behind 'Exit'
+    with raw_mode():
+        while True:
+            action = main_menu(hunter_manager, updater_manager)
+            
+            if action == 'view_hunter_logs':
+                view_logs(hunter_manager)
+            elif action == 'view_updater_logs':
+                view_logs(updater_manager)
+            elif action == 'settings':
+                settings_menu()
+            clear_screen()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Offline DexScreener fixture for checking ultimate_utils changes.
+
+Serves deterministic fake /tokens/v1 responses on localhost and runs the
+updater against them, so changes can be compared without the real API.
+
+    python tools/dex_fixture.py snapshot OUT.json [N]
+        Run DexScreener.update_data_tokens() (which also runs TokenSelector)
+        for SOL plus N tokens (default 100) and write data_tokens.json and
+        tokens.json to OUT.json with the run-time timestamps removed. Take a
+        snapshot before and after a change and diff the two files.
+
+    python tools/dex_fixture.py bench [N]
+        Time process_token_data() on N tokens (default 1000) against a
+        pickle round trip of the same raw and cleaned records.
+"""
+
+import json
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SOL = "So11111111111111111111111111111111111111112"
+CHUNK_SIZE = 30  # Addresses per request, as in update_data_tokens()
+
+
+def fake_pair(addr, i):
+    """One DexScreener pair record; the same address always gives the same data."""
+    rng = random.Random(addr)
+    return {
+        "chainId": "solana", "dexId": "raydium", "url": "u", "pairAddress": "p" + addr,
+        "baseToken": {"address": addr, "name": "N" + addr, "symbol": "S" + addr},
+        "quoteToken": {"address": SOL, "name": "Wrapped SOL", "symbol": "SOL"},
+        "priceNative": "0.0001", "priceUsd": "160.5" if addr == SOL else "0.0000%d" % (i % 9 + 1),
+        "txns": {k: {"buys": rng.randint(0, 500), "sells": rng.randint(0, 500)} for k in ("m5", "h1", "h6", "h24")},
+        "volume": {k: round(rng.uniform(0, 1e6), 2) for k in ("m5", "h1", "h6", "h24")},
+        "priceChange": {k: round(rng.uniform(-50, 50), 2) for k in ("m5", "h1", "h6", "h24")},
+        "liquidity": {"usd": round(rng.uniform(0, 2e6), 2), "base": 1, "quote": 2},
+        "fdv": 1000, "marketCap": rng.choice([1000, 2e8]),
+        "pairCreatedAt": 123,
+        "info": {"imageUrl": "img", "websites": [{"label": "w", "url": "x"}], "socials": [{"type": "t", "url": "y"}]},
+        "boosts": {"active": 1},
+    }
+
+
+def fake_response(addresses):
+    return [fake_pair(addr, i) for i, addr in enumerate(addresses)]
+
+
+def token_list(n):
+    return [SOL] + ["T%03d" % i for i in range(n)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        addresses = self.path.rsplit("/", 1)[1].split(",")
+        body = json.dumps(fake_response(addresses)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def _work_dir(n):
+    """Run inside a temp dir holding the input files the updater reads from its cwd."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            with open("valid_tokens.json", "w") as f:
+                json.dump(token_list(n), f)
+            with open("settings_config.json", "w") as f:
+                json.dump({"settings_config": {"max_concurrent_positions": 3}}, f)
+            yield
+        finally:
+            os.chdir(cwd)
+
+
+def snapshot(out_path, n=100):
+    out_path = os.path.abspath(out_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    with _work_dir(n):
+        try:
+            import ultimate_utils
+            dex = ultimate_utils.DexScreener()
+            dex.api_url = "http://127.0.0.1:%d/tokens/v1/{chainId}/{addresses}" % server.server_port
+            dex.update_data_tokens()
+            with open("data_tokens.json", encoding="utf-8") as f:
+                data_tokens = json.load(f)
+            with open("tokens.json", encoding="utf-8") as f:
+                tokens = json.load(f)
+        finally:
+            server.shutdown()
+    for token in data_tokens:
+        token.pop("last_updated")
+        token.pop("fetch_timestamp")
+    tokens["metadata"].pop("analysis_time")
+    tokens["metadata"]["processing_stats"].pop("analysis_duration_sec")
+    for token in tokens["tokens"]:
+        token.pop("timestamp")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"data_tokens": data_tokens, "tokens": tokens}, f, indent=2, sort_keys=True)
+    print(f"Wrote {out_path}")
+
+
+def bench(n=1000, repeat=5):
+    import ultimate_utils
+    with _work_dir(n):
+        dex = ultimate_utils.DexScreener()
+    tokens = token_list(n)
+    raw = []
+    for start in range(0, len(tokens), CHUNK_SIZE):
+        raw.extend(fake_response(tokens[start:start + CHUNK_SIZE]))
+
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t)
+        return min(times) * 1000
+
+    cleaned = dex.process_token_data(raw)
+    clean_ms = best(lambda: dex.process_token_data(raw))
+    pickle_ms = best(lambda: (pickle.loads(pickle.dumps(raw)), pickle.loads(pickle.dumps(cleaned))))
+    print(f"{len(raw)} tokens: process_token_data {clean_ms:.1f} ms, "
+          f"pickle round trip of raw + cleaned {pickle_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "snapshot":
+        snapshot(sys.argv[2], *map(int, sys.argv[3:4]))
+    elif len(sys.argv) >= 2 and sys.argv[1] == "bench":
+        bench(*map(int, sys.argv[2:3]))
+    else:
+        sys.exit(__doc__)
@@ -1,12 +1,55 @@
 # token_utils.py
 
+import heapq
 import json
-import requests
+import logging
+import os
+import tempfile
 import time
+from bisect import bisect_right
 from datetime import datetime
 from itertools import islice
-from threading import Thread
-from typing import List, Dict, Any
+from operator import itemgetter
+from threading import Thread, Lock, Event
+from typing import TYPE_CHECKING, Iterable, List, Dict, Any
+
+if TYPE_CHECKING:
+    import requests
+
+__all__ = ["DexScreener", "TokenSelector"]
+
+logger = logging.getLogger(__name__)
+
+# orjson parses/serializes bytes directly and is much faster than json, which
+# is the fallback. Output files are only machine-read, so both write compact JSON
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+def _write_json_atomic(path, obj):
+    # Output files are machine-read, so write them compact; write a sibling
+    # temp file and swap it in so readers never see a half-written file.
+    # ILove.py refreshes from several threads at once, so every write gets
+    # its own temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(obj))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; keep the usual file mode
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 class DexScreener:
     def __init__(self, valid_tokens_path='valid_tokens.json', output_path='data_tokens.json', chain_id='solana'):
@@ -14,25 +57,63 @@ class DexScreener:
         self.output_path = output_path
         self.chain_id = chain_id
         self.api_url = "https://api.dexscreener.com/tokens/v1/{chainId}/{addresses}"
-        self.rate_limit_delay = 0.2
+        self.rate_limit_delay = 0.2  # Min spacing between request starts (300 req/min)
         self.max_retries = 3
+        self.max_workers = 5
+        self.session = self.create_session()
+        self._rate_lock = Lock()
+        self._next_request_at = 0.0
+        self.update_interval = 300
+        self._stop = Event()
+        self._json_cache = {}  # path -> ((st_mtime_ns, st_size, st_ino), parsed data)
         self.max_concurrent_positions = self.load_max_concurrent_positions()
 
+    def create_session(self) -> "requests.Session":
+        # requests/urllib3 are imported here rather than at module level so
+        # importing TokenSelector alone stays cheap.
+        # One pooled session keeps connections alive across chunk requests.
+        # Retries stay in fetch_token_data() so each attempt goes through
+        # wait_for_rate_limit()
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        # Set once per session instead of per request. Accept-Encoding is left
+        # to requests, which already asks for gzip/deflate (and br/zstd when
+        # their decoders are installed)
+        session.headers["Accept"] = "application/json"
+        return session
+
+    def load_json_cached(self, path):
+        # Re-parse only when the file changes; between scheduler runs these
+        # files are usually untouched. ILove.py rewrites valid_tokens.json in
+        # place, possibly twice within one coarse mtime tick, so size and
+        # inode are part of the key too
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._json_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
+        self._json_cache[path] = (key, data)
+        return data
+
     def load_max_concurrent_positions(self) -> int:
         try:
-            with open('settings_config.json', 'r') as f:
-                config = json.load(f)
-                return config.get('settings_config', {}).get('max_concurrent_positions', 1)
+            config = self.load_json_cached('settings_config.json')
+            return config.get('settings_config', {}).get('max_concurrent_positions', 1)
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"[Warning] Failed to load trade_config.json: {e}. Using default max_concurrent_positions=1")
+            logger.warning("Failed to load trade_config.json: %s. Using default max_concurrent_positions=1", e)
             return 1
 
     def load_valid_tokens(self) -> List[str]:
         try:
-            with open(self.valid_tokens_path, 'r') as f:
-                return json.load(f)
+            return self.load_json_cached(self.valid_tokens_path)
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"[Error] Failed to load valid tokens: {e}")
+            logger.error("Failed to load valid tokens: %s", e)
             return []
 
     def chunks(self, iterable, size):
@@ -40,122 +121,168 @@ class DexScreener:
         while chunk := list(islice(it, size)):
             yield chunk
 
+    def wait_for_rate_limit(self):
+        # Reserve the next start slot under the lock, sleep outside it, so
+        # concurrent workers stay spaced by rate_limit_delay
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.rate_limit_delay
+        if start_at > now:
+            time.sleep(start_at - now)
+
     def fetch_token_data(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        import requests
+
         url = self.api_url.format(chainId=self.chain_id, addresses=",".join(addresses))
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, headers={"Accept": "application/json"}, timeout=10)
+                self.wait_for_rate_limit()
+                response = self.session.get(url, timeout=10)
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
+                # Parse the raw body; skips requests' charset detection and text decode
+                return _json_loads(response.content)
+            except (requests.exceptions.RequestException, ValueError) as e:
                 if attempt < self.max_retries - 1:
                     time.sleep((attempt + 1) * 2)
                     continue
-                print(f"[Error] Failed to fetch data: {e}")
+                logger.error("Failed to fetch data: %s", e)
                 return []
 
-    def process_token_data(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def process_token_data(self, raw_data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         cleaned_data = []
         now = int(time.time())
         for item in raw_data:
             try:
-                websites = [{"label": s.get("label", ""), "url": s.get("url", "")} for s in item.get("info", {}).get("websites", [])]
-                socials = [{"type": s.get("type", ""), "url": s.get("url", "")} for s in item.get("info", {}).get("socials", [])]
+                # Look up each nested section once instead of once per field
+                info = item.get("info") or {}
+                base = item.get("baseToken") or {}
+                quote = item.get("quoteToken") or {}
+                price_change = item.get("priceChange") or {}
+                txns = item.get("txns") or {}
+                volume = item.get("volume") or {}
+                liquidity = item.get("liquidity") or {}
+                txns_m5 = txns.get("m5") or {}
+                txns_h1 = txns.get("h1") or {}
+                txns_h6 = txns.get("h6") or {}
+                txns_h24 = txns.get("h24") or {}
+                websites = [{"label": s.get("label", ""), "url": s.get("url", "")} for s in info.get("websites", [])]
+                socials = [{"type": s.get("type", ""), "url": s.get("url", "")} for s in info.get("socials", [])]
                 cleaned = {
                     "chain_id": item.get("chainId", ""),
                     "dex_id": item.get("dexId", ""),
                     "pair_address": item.get("pairAddress", ""),
                     "url": item.get("url", ""),
                     "created_at": item.get("pairCreatedAt", 0),
-                    "token_mint": item.get("baseToken", {}).get("address", ""),
-                    "token_name": item.get("baseToken", {}).get("name", ""),
-                    "token_symbol": item.get("baseToken", {}).get("symbol", ""),
+                    "token_mint": base.get("address", ""),
+                    "token_name": base.get("name", ""),
+                    "token_symbol": base.get("symbol", ""),
                     "quote_token": {
-                        "address": item.get("quoteToken", {}).get("address", ""),
-                        "name": item.get("quoteToken", {}).get("name", ""),
-                        "symbol": item.get("quoteToken", {}).get("symbol", "")
+                        "address": quote.get("address", ""),
+                        "name": quote.get("name", ""),
+                        "symbol": quote.get("symbol", "")
                     },
                     "price_native": item.get("priceNative", "0"),
                     "price_usd": item.get("priceUsd", "0"),
                     "price_change": {
-                        "m5": item.get("priceChange", {}).get("m5", 0),
-                        "h1": item.get("priceChange", {}).get("h1", 0),
-                        "h6": item.get("priceChange", {}).get("h6", 0),
-                        "h24": item.get("priceChange", {}).get("h24", 0)
+                        "m5": price_change.get("m5", 0),
+                        "h1": price_change.get("h1", 0),
+                        "h6": price_change.get("h6", 0),
+                        "h24": price_change.get("h24", 0)
                     },
                     "transactions": {
                         "buys": {
-                            "m5": item.get("txns", {}).get("m5", {}).get("buys", 0),
-                            "h1": item.get("txns", {}).get("h1", {}).get("buys", 0),
-                            "h6": item.get("txns", {}).get("h6", {}).get("buys", 0),
-                            "h24": item.get("txns", {}).get("h24", {}).get("buys", 0)
+                            "m5": txns_m5.get("buys", 0),
+                            "h1": txns_h1.get("buys", 0),
+                            "h6": txns_h6.get("buys", 0),
+                            "h24": txns_h24.get("buys", 0)
                         },
                         "sells": {
-                            "m5": item.get("txns", {}).get("m5", {}).get("sells", 0),
-                            "h1": item.get("txns", {}).get("h1", {}).get("sells", 0),
-                            "h6": item.get("txns", {}).get("h6", {}).get("sells", 0),
-                            "h24": item.get("txns", {}).get("h24", {}).get("sells", 0)
+                            "m5": txns_m5.get("sells", 0),
+                            "h1": txns_h1.get("sells", 0),
+                            "h6": txns_h6.get("sells", 0),
+                            "h24": txns_h24.get("sells", 0)
                         }
                     },
                     "volume": {
-                        "m5": item.get("volume", {}).get("m5", 0),
-                        "h1": item.get("volume", {}).get("h1", 0),
-                        "h6": item.get("volume", {}).get("h6", 0),
-                        "h24": item.get("volume", {}).get("h24", 0)
+                        "m5": volume.get("m5", 0),
+                        "h1": volume.get("h1", 0),
+                        "h6": volume.get("h6", 0),
+                        "h24": volume.get("h24", 0)
                     },
                     "liquidity": {
-                        "usd": item.get("liquidity", {}).get("usd", 0),
-                        "base": item.get("liquidity", {}).get("base", 0),
-                        "quote": item.get("liquidity", {}).get("quote", 0)
+                        "usd": liquidity.get("usd", 0),
+                        "base": liquidity.get("base", 0),
+                        "quote": liquidity.get("quote", 0)
                     },
                     "market_cap": item.get("marketCap", 0),
                     "fdv": item.get("fdv", 0),
                     "info": {
-                        "image_url": item.get("info", {}).get("imageUrl", ""),
-                        "header_image": item.get("info", {}).get("header", ""),
-                        "open_graph": item.get("info", {}).get("openGraph", ""),
+                        "image_url": info.get("imageUrl", ""),
+                        "header_image": info.get("header", ""),
+                        "open_graph": info.get("openGraph", ""),
                         "websites": websites,
                         "socials": socials
                     },
-                    "boosts": item.get("boosts", {}).get("active", 0),
+                    "boosts": (item.get("boosts") or {}).get("active", 0),
                     "last_updated": now,
                     "fetch_timestamp": now
                 }
                 cleaned_data.append(cleaned)
             except Exception as e:
-                print(f"[Error] Processing token: {e}")
+                logger.error("Processing token: %s", e)
                 continue
         return cleaned_data
 
     def update_data_tokens(self):
+        from concurrent.futures import ThreadPoolExecutor
+
         tokens = self.load_valid_tokens()
+        # Cheap while the settings file is unchanged, so pick up edits every run
+        self.max_concurrent_positions = self.load_max_concurrent_positions()
         if not tokens:
-            print("[Warning] No tokens found")
+            logger.warning("No tokens found")
             return
-        all_raw_data = []
-        for chunk in self.chunks(tokens, 30):
-            data = self.fetch_token_data(chunk)
-            if data:
-                all_raw_data.extend(data)
-            time.sleep(self.rate_limit_delay)
-        cleaned = self.process_token_data(all_raw_data)
+        cleaned = []
+        chunks = list(self.chunks(tokens, 30))
+        # Requests overlap instead of running back to back; map() keeps chunk order.
+        # Each response is cleaned as soon as it arrives, so only one raw chunk
+        # is held at a time instead of every raw response of the run
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            for data in executor.map(self.fetch_token_data, chunks):
+                if data:
+                    cleaned.extend(self.process_token_data(data))
         try:
-            with open(self.output_path, 'w') as f:
-                json.dump(cleaned, f, indent=2)
-            print(f"[Success] Saved {len(cleaned)} tokens")
+            _write_json_atomic(self.output_path, cleaned)
+            logger.info("Saved %d tokens", len(cleaned))
         except Exception as e:
-            print(f"[Error] Writing file: {e}")
+            logger.error("Writing file: %s", e)
 
         # Call TokenSelector with max_concurrent_positions
         selector = TokenSelector(cleaned, self.max_concurrent_positions)
         selector.update_selected_tokens()
 
-    def start_scheduler(self):
+    def start_scheduler(self) -> Thread:
         def loop():
             while True:
+                started = time.monotonic()
                 self.update_data_tokens()
-                time.sleep(300)
-        Thread(target=loop, daemon=True).start()
+                # Subtract the run time so the cadence doesn't drift; returns early on stop
+                if self._stop.wait(max(0, self.update_interval - (time.monotonic() - started))):
+                    return
+        thread = Thread(target=loop, daemon=True)
+        thread.start()
+        return thread
+
+    def stop_scheduler(self):
+        self._stop.set()
+
+# Pulls the per-window values out of a volume/price_change/txns section
+_WINDOWS = itemgetter("m5", "h1", "h6", "h24")
+
+# Score thresholds and the priority at or above each: <0 avoid, >=0 low, >=3 medium, >=5 high
+_PRIORITY_CUTS = (0, 3, 5)
+_PRIORITIES = ("avoid", "low", "medium", "high")
 
 class TokenSelector:
     def __init__(self, tokens: List[Dict[str, Any]], max_positions: int = 1):
@@ -169,10 +296,19 @@ class TokenSelector:
             score = 0
             reasons = []
 
+            # Pull every scoring input out of the nested record up front;
+            # these are JSON numbers already, so no float() coercion needed
+            price_change = token["price_change"]
+            txns = token["transactions"]
+            price_change_h1 = price_change["h1"]
+            price_change_h24 = price_change["h24"]
+            buys_h1 = txns["buys"]["h1"]
+            sells_h1 = txns["sells"]["h1"]
+            volume_h1 = token["volume"]["h1"]
+            liquidity = token["liquidity"]["usd"]
+            market_cap = token["market_cap"]
+
             # Price change scoring
-            price_change_h1 = float(token["price_change"]["h1"])
-            price_change_h24 = float(token["price_change"]["h24"])
-            
             if price_change_h1 > 0:
                 score += price_change_h1 * 0.5
                 reasons.append(f"Price up {price_change_h1:.2f}% (1h)")
@@ -182,8 +318,6 @@ class TokenSelector:
                 reasons.append(f"Price up {price_change_h24:.2f}% (24h)")
 
             # Buy/sell ratio scoring
-            buys_h1 = float(token["transactions"]["buys"]["h1"])
-            sells_h1 = float(token["transactions"]["sells"]["h1"])
             buy_sell_ratio = buys_h1 / (sells_h1 + 1)  # Add 1 to avoid division by zero
             
             if buy_sell_ratio > 1.5:
@@ -194,7 +328,6 @@ class TokenSelector:
                 reasons.append(f"Sell pressure (ratio: {buy_sell_ratio:.2f})")
 
             # Volume scoring
-            volume_h1 = float(token["volume"]["h1"])
             if volume_h1 > 50000:
                 score += 1
                 reasons.append("Strong 1h volume")
@@ -203,7 +336,6 @@ class TokenSelector:
                 reasons.append("Low 1h volume")
 
             # Liquidity scoring
-            liquidity = float(token["liquidity"]["usd"])
             if liquidity > 1000000:
                 score += 2
                 reasons.append("Good liquidity (>$1M)")
@@ -215,80 +347,77 @@ class TokenSelector:
                 reasons.append("Low liquidity (<$50K)")
 
             # Market cap consideration
-            market_cap = float(token["market_cap"])
             if market_cap > 100000000 and score > 0:
                 score += 1  # Bonus for established tokens with positive indicators
 
             return round(score, 2), reasons
         except Exception as e:
-            print(f"[Error] Scoring token {token.get('token_symbol', 'unknown')}: {e}")
+            logger.error("Scoring token %s: %s", token.get('token_symbol', 'unknown'), e)
             return 0, [f"Error scoring: {e}"]
 
     def determine_priority(self, score: float) -> str:
-        if score >= 5:
-            return "high"
-        elif score >= 3:
-            return "medium"
-        elif score >= 0:
-            return "low"
-        else:
-            return "avoid"
+        return _PRIORITIES[bisect_right(_PRIORITY_CUTS, score)]
+
+    def build_token_data(self, token, score, reasons, analysis_time):
+        priority = self.determine_priority(score)
+        volume_m5, volume_h1, volume_h6, volume_h24 = _WINDOWS(token["volume"])
+        txns = token["transactions"]
+        buys_m5 = float(txns["buys"]["m5"])
+        sells_m5 = float(txns["sells"]["m5"])
+
+        return {
+            "token_info": {
+                "name": token["token_name"],
+                "symbol": token["token_symbol"],
+                "mint": token["token_mint"]
+            },
+            "metrics": {
+                "price": float(token["price_usd"]),
+                "price_change": round(float(token["price_change"]["h24"]), 2),
+                "liquidity": round(float(token["liquidity"]["usd"]), 2),
+                "market_cap": round(float(token["market_cap"]), 2),
+                "volume_m5": round(float(volume_m5), 2),
+                "volume_h1": round(float(volume_h1), 2),
+                "volume_h6": round(float(volume_h6), 2),
+                "volume_h24": round(float(volume_h24), 2),
+                "buys_m5": buys_m5,
+                "sells_m5": sells_m5,
+                "buy_sell_ratio": round(buys_m5 / (sells_m5 + 1), 2)
+            },
+            "analysis": {
+                "score": score,
+                "reasons": reasons,
+                "priority": priority
+            },
+            "timestamp": analysis_time
+        }
 
     def update_selected_tokens(self):
-        start_time = time.time()
+        start_time = time.monotonic()
         analysis_time = datetime.now().isoformat()
-        scored_tokens = []
         
-        # First pass to get SOL price if available
+        # Score all tokens, picking up the SOL price on the way. Only keep
+        # (score, reasons, token) here; the output dicts are built for the
+        # selected tokens alone
+        scored_tokens = []
         for token in self.tokens:
             if token["token_mint"] == self.sol_mint:
                 try:
                     self.sol_price = float(token["price_usd"])
                 except:
                     pass
-
-        # Score all tokens
-        for token in self.tokens:
-            if token["token_mint"] == self.sol_mint:
                 continue  # Skip SOL itself
                 
             score, reasons = self.score_token(token)
-            priority = self.determine_priority(score)
-            
-            token_data = {
-                "token_info": {
-                    "name": token["token_name"],
-                    "symbol": token["token_symbol"],
-                    "mint": token["token_mint"]
-                },
-                "metrics": {
-                    "price": float(token["price_usd"]),
-                    "price_change": round(float(token["price_change"]["h24"]), 2),
-                    "liquidity": round(float(token["liquidity"]["usd"]), 2),
-                    "market_cap": round(float(token["market_cap"]), 2),
-                    "volume_m5": round(float(token["volume"]["m5"]), 2),
-                    "volume_h1": round(float(token["volume"]["h1"]), 2),
-                    "volume_h6": round(float(token["volume"]["h6"]), 2),
-                    "volume_h24": round(float(token["volume"]["h24"]), 2),
-                    "buys_m5": float(token["transactions"]["buys"]["m5"]),
-                    "sells_m5": float(token["transactions"]["sells"]["m5"]),
-                    "buy_sell_ratio": round(float(token["transactions"]["buys"]["m5"]) / 
-                                      (float(token["transactions"]["sells"]["m5"]) + 1), 2)
-                },
-                "analysis": {
-                    "score": score,
-                    "reasons": reasons,
-                    "priority": priority
-                },
-                "timestamp": datetime.now().isoformat()
-            }
-            scored_tokens.append(token_data)
+            scored_tokens.append((score, reasons, token))
 
-        # Sort tokens by score in descending order
-        scored_tokens.sort(key=lambda x: x["analysis"]["score"], reverse=True)
-        
-        # Select only the top N tokens based on max_concurrent_positions
-        selected_tokens = scored_tokens[:self.max_positions]
+        # Select only the top N tokens based on max_concurrent_positions.
+        # nlargest keeps an N-sized heap instead of sorting every token, and
+        # orders ties exactly like a stable descending sort would
+        selected_tokens = [
+            self.build_token_data(token, score, reasons, analysis_time)
+            for score, reasons, token in heapq.nlargest(self.max_positions, scored_tokens, key=itemgetter(0))
+        ]
         
         # Prepare the final output structure
         output = {
@@ -300,7 +429,7 @@ class TokenSelector:
                     "total_tokens": len(scored_tokens),
                     "processed": len(scored_tokens),
                     "errors": 0,
-                    "analysis_duration_sec": round(time.time() - start_time, 2)
+                    "analysis_duration_sec": round(time.monotonic() - start_time, 2)
                 },
                 "max_concurrent_positions": self.max_positions,
                 "selected_tokens_count": len(selected_tokens)
@@ -309,14 +438,13 @@ class TokenSelector:
         }
 
         try:
-            with open('tokens.json', 'w') as f:
-                json.dump(output, f, indent=2)
-            print(f"[Info] Selected {len(selected_tokens)} tokens (max_concurrent_positions={self.max_positions})")
+            _write_json_atomic('tokens.json', output)
+            logger.info("Selected %d tokens (max_concurrent_positions=%d)", len(selected_tokens), self.max_positions)
         except Exception as e:
-            print(f"[Error] Saving tokens.json: {e}")
+            logger.error("Saving tokens.json: %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     dex = DexScreener()
-    dex.start_scheduler()
-    while True:
-        time.sleep(1)
+    # Sleeps until the scheduler thread ends instead of waking every second
+    dex.start_scheduler().join()